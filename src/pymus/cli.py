@@ -2,7 +2,12 @@
 import curses
 import os
 import time
+from bisect import bisect_left
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
+from queue import Empty, Queue
+from threading import Event
 import vlc
 from mutagen.easyid3 import EasyID3
 from mutagen.id3._util import ID3NoHeaderError
@@ -47,12 +52,15 @@ def load_music_root() -> Path:
 AUDIO_EXTS = {".mp3"}
 MUSIC_ROOT = load_music_root()
 ID3_CACHE = {}
+MP3_CACHE = {}  # folder -> (list of (dir, (st_mtime_ns, st_ctime_ns)) seen while scanning, sorted mp3s)
+SCAN_WORKERS = 8  # folders listed concurrently by collect_mp3s
 NOWPLAYING_COLOR = None
 PLAYLIST_STATE_PATH = Path.home() / ".pymus" / "playlist.json"
+SCAN_BUSY_MSG = "Still scanning the previous folder..."
 
 
 ################################################################################
-def get_id3_label(path: Path) -> str:
+def get_id3_label(path: str) -> str:
     """
     Return 'Artist — Title' from ID3 if available.
     Fallback to filename stem (no extension).
@@ -61,7 +69,7 @@ def get_id3_label(path: Path) -> str:
     if p in ID3_CACHE:
         return ID3_CACHE[p]
 
-    label = path.stem  # fallback
+    label = os.path.splitext(os.path.basename(p))[0]  # fallback
 
     try:
         tags = EasyID3(p)
@@ -144,46 +152,189 @@ def save_playlist_state(player):
 
 
 def list_dir(path: Path):
-    """Return sorted entries for left pane: dirs first, then MP3 files only."""
+    """
+    Return sorted entries for left pane: dirs first, then MP3 files only.
+    Each entry is a (Path, is_dir) tuple so callers never need to re-check.
+    """
+    # Single pass: bucket each entry as dir / MP3 / ignored, keeping its
+    # (lowercased name, name) sort key. DirEntry.is_dir()/is_file() are
+    # answered from the directory listing itself, so no extra stat() per
+    # entry (unlike Path.iterdir()).
+    dirs = []
+    mp3_files = []
     try:
-        entries = list(path.iterdir())
-    except PermissionError:
+        with os.scandir(path) as it:
+            for e in it:
+                n = e.name
+                if e.is_dir():
+                    dirs.append((n.lower(), n, e.path))
+                elif len(n) >= 4 and n[-4:].lower() == ".mp3" and e.is_file():
+                    mp3_files.append((n.lower(), n, e.path))
+    except OSError:
         return []
 
-    dirs = sorted([e for e in entries if e.is_dir()], key=lambda p: p.name.lower())
-    mp3_files = sorted(
-        [e for e in entries if e.is_file() and e.suffix.lower() in AUDIO_EXTS],
-        key=lambda p: p.name.lower(),
-    )
-    return dirs + mp3_files
+    dirs.sort()
+    mp3_files.sort()
+    return [(Path(p), True) for _, _, p in dirs] + [(Path(p), False) for _, _, p in mp3_files]
+
+
+def build_entries_view(entries):
+    """Precompute the (display name, attr) of each browser entry, once per listing."""
+    return [(p.name + "/", curses.A_BOLD) if is_dir else (p.name, curses.A_NORMAL) for p, is_dir in entries]
+
 
+def dir_stamp(d: str):
+    """
+    (st_mtime_ns, st_ctime_ns) of a folder. mtime moves when entries are
+    added, removed or renamed; ctime also moves on chmod, so a folder that
+    was skipped as unreadable gets rescanned once it is made readable.
+    """
+    st = os.stat(d)
+    return st.st_mtime_ns, st.st_ctime_ns
+
+
+def stamp_unchanged(entry) -> bool:
+    """True if a (dir, stamp) pair still matches what is on disk."""
+    d, stamp = entry
+    try:
+        return dir_stamp(d) == stamp
+    except OSError:
+        return False
+
+
+def dirs_unchanged(dir_stamps, pool, stop: Event = None) -> bool:
+    """
+    True if every (dir, stamp) pair still matches what is on disk.
+    The stats run on pool, like the listings of a scan, and go in chunks so
+    a change found early (or stop being set) skips the rest of the checks.
+    """
+    if not dir_stamps:
+        return False  # nothing was recorded (root missing): always rescan
+    step = 2 * SCAN_WORKERS
+    for i in range(0, len(dir_stamps), step):
+        if stop is not None and stop.is_set():
+            return False
+        if not all(pool.map(stamp_unchanged, dir_stamps[i : i + step])):
+            return False
+    return True
+
+
+def scan_dir(d: str):
+    """
+    List one folder for collect_mp3s.
+    Returns (dir_stamp() or None, subfolder paths, [(lowercased name, path)] of mp3s).
+    """
+    subdirs = []
+    mp3s = []
+    try:
+        # stat before listing, so a change made mid-scan invalidates next time
+        stamp = dir_stamp(d)
+    except OSError:
+        return None, subdirs, mp3s
+    try:
+        with os.scandir(d) as it:
+            for de in it:
+                if de.is_dir(follow_symlinks=False):
+                    subdirs.append(de.path)
+                else:
+                    # Only the 4-char suffix is lowercased for non-matches
+                    # (cover art, playlists...); no Path is ever built here.
+                    n = de.name
+                    if len(n) >= 4 and n[-4:].lower() == ".mp3":
+                        mp3s.append((n.lower(), de.path))  # sort key computed once, here
+    except OSError:
+        pass  # unreadable folder: skip its contents, like os.walk does
+    return stamp, subdirs, mp3s
 
-def collect_mp3s(folder: Path):
-    """Recursively collect mp3 files, sorted A-Z0-9 by filename."""
+
+def collect_mp3s(folder: Path, stop: Event = None):
+    """
+    Recursively collect mp3 files (as path strings), sorted A-Z0-9 by filename.
+    Results are cached per folder and reused until the stamp of any
+    directory in the tree changes (files added, removed or renamed,
+    permissions changed). A folder that can't be read at all isn't cached.
+    If stop is set while checking the cache or mid-walk, the remaining stats
+    and listings are dropped and [] is returned (nothing cached), so quitting
+    doesn't wait for a large tree.
+    """
+    key = str(folder)
+    cached = MP3_CACHE.get(key)
     files = []
-    for root, _, fnames in os.walk(folder):
-        for f in fnames:
-            p = Path(root) / f
-            if p.suffix.lower() in AUDIO_EXTS:
-                files.append(p)
-    return sorted(files, key=lambda p: p.name.lower())
+    dir_stamps = []
+    # Folders are stat'ed and listed on a small thread pool: each call blocks
+    # in the kernel (or on a network share's round trip), so several can overlap.
+    # Only 2 * SCAN_WORKERS listings are queued at a time; the rest wait in todo.
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+        if cached and dirs_unchanged(cached[0], pool, stop):
+            return list(cached[1])  # copy: the queue mutates its list in place
+        # (a stop during that check falls through to the walk, which returns [] at once)
+
+        todo = [key]
+        pending = {}  # future -> folder
+        while todo or pending:
+            if stop is not None and stop.is_set():
+                for future in pending:
+                    future.cancel()  # listings already running finish on their own
+                return []
+            while todo and len(pending) < 2 * SCAN_WORKERS:
+                d = todo.pop()
+                pending[pool.submit(scan_dir, d)] = d
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                d = pending.pop(future)
+                stamp, subdirs, mp3s = future.result()
+                if stamp is not None:
+                    dir_stamps.append((d, stamp))
+                todo.extend(subdirs)
+                files.extend(mp3s)
+    files.sort()
+    files = [p for _, p in files]
+    if dir_stamps:
+        MP3_CACHE[key] = (dir_stamps, files)
+    return list(files)
+
+
+def mp3_index(mp3s, path) -> int:
+    """
+    Position of path in a collect_mp3s() result, or 0 if it isn't there.
+    Binary search on the same (lowercased name, path) key the list is sorted by.
+    """
+    p = str(path)
+    i = bisect_left(mp3s, (os.path.basename(p).lower(), p), key=lambda q: (os.path.basename(q).lower(), q))
+    return i if i < len(mp3s) and mp3s[i] == p else 0
 
 
-def apply_filter(entries, text: str):
-    """Filter entries by substring (case-insensitive) on name."""
+def apply_filter(names_lower, text: str, prev_text: str = "", prev=None):
+    """
+    Filter entries by substring (case-insensitive) on name.
+    names_lower holds each entry's name, lowercased once per listing.
+    Returns the indices of matching entries. If prev holds the indices
+    that matched prev_text and text extends prev_text, only those are
+    re-checked.
+    """
     if not text:
-        return entries
+        return list(range(len(names_lower)))
     t = text.lower()
-    return [e for e in entries if t in e.name.lower()]
+    candidates = prev if prev is not None and t.startswith(prev_text.lower()) else range(len(names_lower))
+    return [i for i in candidates if t in names_lower[i]]
+
 
+@lru_cache(maxsize=4096)
+def fmt_mmss(t: int) -> str:
+    """Whole seconds as m:ss; cached, as the same few values repeat every redraw."""
+    t = max(0, t)
+    m = t // 60
+    s = t % 60
+    return f"{m}:{s:02d}"
 
-def draw_help_line(stdscr, y, fragments):
+
+def draw_help_line(win, y, fragments):
     """
     Draw styled help fragments safely in narrow terminals.
     Stops drawing when no space remains.
     """
     x = 0
-    _, w = stdscr.getmaxyx()
+    _, w = win.getmaxyx()
 
     for text, attr in fragments:
         if x >= w - 1:
@@ -193,7 +344,7 @@ def draw_help_line(stdscr, y, fragments):
         if avail <= 0:
             break  # avoid addnstr(..., n<=0)
 
-        stdscr.addnstr(y, x, text, avail, attr)
+        win.addnstr(y, x, text, avail, attr)
         x += len(text)
 
 
@@ -201,27 +352,98 @@ class AudioPlayer:
     def __init__(self):
         self.instance = vlc.Instance("--no-video", "--quiet")
         self.player = self.instance.media_player_new()  # type: ignore
+        # The queue is kept as two parallel lists, changed in lockstep:
+        # full paths (for VLC/ID3/saving) and file names (for the queue pane).
         self.queue = []
+        self.names = []
         self.idx = -1
         self.paused = False
+        self.version = 0  # bumped on every queue change, so the UI knows to redraw it
+        self._label = (None, None)  # ((version, idx), now-playing label)
+        self._last_progress = (0.0, 0.0, 0.0)  # (pos, length, time.monotonic() of the VLC query)
+        self._next_media = None  # (path, vlc.Media) prepared for the track after the current one
+        # VLC announces end-of-track from its own thread; pass it to the UI loop through a queue
+        self._ended = Queue()
+        # Keep the manager: it owns the ctypes callback libVLC calls, and is freed (crashing VLC's thread) if dropped
+        self._events = self.player.event_manager()  # type: ignore
+        self._events.event_attach(vlc.EventType.MediaPlayerEndReached, self._on_end_reached)
+
+    def _on_end_reached(self, event):
+        # Runs on a libVLC thread, where calling back into libVLC can deadlock: just record it.
+        self._ended.put(True)
+
+    def track_ended(self) -> bool:
+        """True if VLC reported the end of a track since the last call."""
+        try:
+            self._ended.get_nowait()
+            return True
+        except Empty:
+            return False
 
     def set_queue(self, files):
-        self.queue = files
+        self.queue = [str(p) for p in files]
+        self.names = [os.path.basename(p) for p in self.queue]
         self.idx = 0 if files else -1
+        self.version += 1
+        self._drop_next_media()
 
     def current(self):
+        """Path (str) of the current track, or None."""
         if 0 <= self.idx < len(self.queue):
             return self.queue[self.idx]
         return None
 
+    def current_name(self):
+        """File name of the current track, or None."""
+        if 0 <= self.idx < len(self.names):
+            return self.names[self.idx]
+        return None
+
+    def current_label(self):
+        """ID3 label of the current track (None if none), looked up once per track."""
+        key = (self.version, self.idx)
+        if self._label[0] != key:
+            cur = self.current()
+            self._label = (key, get_id3_label(cur) if cur else None)
+        return self._label[1]
+
     def play_current(self):
         cur = self.current()
         if not cur:
             return
-        media = self.instance.media_new(str(cur))  # type: ignore
+        # Reuse the media prepared while the previous track played, if it is this one
+        prepared = self._next_media
+        if prepared and prepared[0] == cur:
+            media = prepared[1]
+            self._next_media = None  # handed to the player: not ours to release
+        else:
+            media = self.instance.media_new(cur)  # type: ignore
         self.player.set_media(media)
         self.player.play()
         self.paused = False
+        self._last_progress = (0.0, 0.0, 0.0)  # new track: don't serve the old position
+        self.prepare_next()
+
+    def prepare_next(self):
+        """
+        Create the media for the track after the current one and start
+        libVLC parsing it (on libVLC's own thread), so that moving on to it
+        does not have to open and probe the file first.
+        """
+        self._drop_next_media()
+        nxt = self.queue[(self.idx + 1) % len(self.queue)]
+        media = self.instance.media_new(nxt)  # type: ignore
+        try:
+            media.parse_with_options(vlc.MediaParseFlag.local, 0)  # type: ignore
+        except Exception:
+            pass  # older libVLC: the media still plays, it just isn't pre-parsed
+        self._next_media = (nxt, media)
+
+    def _drop_next_media(self):
+        """Release the prepared media if it was never played (python-vlc doesn't free it)."""
+        if self._next_media:
+            self._next_media[1].release()
+            self._next_media = None
 
     def play_index(self, i: int):
         if not self.queue:
@@ -253,15 +475,26 @@ class AudioPlayer:
         self.play_current()
 
     def progress(self):
-        """Return (pos_seconds, length_seconds) or (0,0)."""
+        """
+        Return (pos_seconds, length_seconds) or (0,0).
+        VLC is asked at most every 0.25 s; in between the last answer is
+        reused, as the UI only shows whole seconds.
+        """
+        pos, length, polled = self._last_progress
+        now = time.monotonic()
+        if now - polled < 0.25:
+            return pos, length
         try:
             pos_ms = self.player.get_time()
             len_ms = self.player.get_length()
             if pos_ms < 0 or len_ms < 0:
-                return 0, 0
-            return pos_ms / 1000.0, len_ms / 1000.0
+                pos, length = 0, 0
+            else:
+                pos, length = pos_ms / 1000.0, len_ms / 1000.0
         except Exception:
-            return 0, 0
+            pos, length = 0, 0
+        self._last_progress = (pos, length, now)
+        return pos, length
 
     def add_to_queue(self, files):
         """Append files to the queue; start playing if idle."""
@@ -269,7 +502,10 @@ class AudioPlayer:
             return
 
         was_empty = len(self.queue) == 0
-        self.queue.extend(files)
+        paths = [str(p) for p in files]
+        self.queue.extend(paths)
+        self.names.extend(os.path.basename(p) for p in paths)
+        self.version += 1
 
         # If nothing was queued/playing before, start from first added item
         if was_empty:
@@ -284,6 +520,8 @@ class AudioPlayer:
         removing_current = i == self.idx
 
         self.queue.pop(i)
+        self.names.pop(i)
+        self.version += 1
 
         if not self.queue:
             # Queue now empty
@@ -315,6 +553,8 @@ class AudioPlayer:
 
         # Swap items
         self.queue[i], self.queue[j] = self.queue[j], self.queue[i]
+        self.names[i], self.names[j] = self.names[j], self.names[i]
+        self.version += 1
 
         # Keep current track pointing to same file
         if self.idx == i:
@@ -332,23 +572,28 @@ class AudioPlayer:
         """
         if not self.queue:
             return
+        self.version += 1
 
-        # If nothing is playing yet or we're at the end, shuffle whole queue (if >1).
+        # If nothing is playing yet or we're at the end, shuffle whole queue.
         if self.idx < 0 or self.idx >= len(self.queue) - 1:
-            if len(self.queue) > 1:
-                random.shuffle(self.queue)
-            return
+            start = 0
+        else:
+            start = self.idx + 1
 
-        # Slice out the future portion, shuffle it, and splice back in.
-        head = self.queue[: self.idx + 1]
-        tail = self.queue[self.idx + 1 :]
-        random.shuffle(tail)
-        self.queue = head + tail
+        # Shuffle the positions of the future portion once and apply the same
+        # order to both lists so paths and names stay paired.
+        order = list(range(start, len(self.queue)))
+        random.shuffle(order)
+        self.queue[start:] = [self.queue[k] for k in order]
+        self.names[start:] = [self.names[k] for k in order]
 
     def clear_queue(self):
         """Stop playback and clear the queue."""
         self.queue = []
+        self.names = []
         self.idx = -1
+        self.version += 1
+        self._drop_next_media()
         self.player.stop()
         self.paused = False
 
@@ -359,19 +604,94 @@ def clamp(n, lo, hi):
 
 def ensure_visible(cursor, top, height, total):
     """Adjust top so cursor is visible within window height."""
-    if total <= height:
-        return 0
-    if cursor < top:
-        return cursor
-    if cursor >= top + height:
-        return cursor - height + 1
-    return top
+    # Scroll up to the cursor, or down just far enough to show it.
+    return 0 if total <= height else max(min(top, cursor), cursor - height + 1)
+
+
+class Screen:
+    """
+    Sub-windows for each UI region (header, left pane, right pane, footer),
+    plus the state each region was last drawn with. draw_ui compares against
+    that state and only repaints regions that actually changed.
+    """
+
+    MIN_W, MIN_H = 120, 12  # tweak to taste
+
+    def __init__(self, stdscr):
+        self.stdscr = stdscr
+        self.drawn = {}
+        self.resize()
+
+    def resize(self):
+        """Re-read the terminal size and rebuild layout + sub-windows."""
+        stdscr = self.stdscr
+        h, w = stdscr.getmaxyx()
+        self.h, self.w = h, w
+        self.mid = w // 2
+        self.list_h = h - 6  # rows per pane list: minus header, pane title and 4 footer rows
+        # Content fills each pane window; only a pane's last row stops a column
+        # short (see draw_ui), as curses errors on writes into a window's bottom-right cell.
+        self.left_w = self.mid - 1
+        self.right_w = w - self.mid
+        self.bar_w = max(10, w - 30)
+        self.bar = (-1, "")  # (filled cells, progress bar string) last built
+        self.drawn.clear()
+        self.fitted = {}  # width -> {text: text padded/cut to width}
+        self.too_small = w < self.MIN_W or h < self.MIN_H
+
+        stdscr.erase()
+        if self.too_small:
+            # If terminal is too small, show a message instead of rendering UI
+            msg = f"Terminal too small for pymus ({w}x{h}). Resize to at least {self.MIN_W}x{self.MIN_H}."
+            stdscr.addnstr(
+                h // 2,
+                max(0, (w - len(msg)) // 2),
+                msg,
+                max(0, w - 1),
+                curses.A_BOLD,
+            )
+            stdscr.noutrefresh()
+            return
+
+        self.header_win = curses.newwin(1, w, 0, 0)
+        self.left_win = curses.newwin(h - 5, self.mid - 1, 1, 0)
+        self.right_win = curses.newwin(h - 5, w - self.mid, 1, self.mid)
+        self.footer_win = curses.newwin(4, w, h - 4, 0)
+
+        # The divider only changes with the terminal size, so it lives on
+        # stdscr (between the panes) and is drawn here rather than per frame,
+        # as one vline call instead of an addch per row.
+        stdscr.vline(1, self.mid - 1, "|", h - 5)
+        stdscr.noutrefresh()
+
+    def changed(self, region, state) -> bool:
+        """Record state for region; True if it differs from what was last drawn."""
+        if region in self.drawn and self.drawn[region] == state:
+            return False
+        self.drawn[region] = state
+        return True
+
+    def fit(self, text, width) -> str:
+        """
+        text padded or cut to exactly width columns. Recently drawn texts are
+        kept (least recently used dropped first, a few screens' worth per
+        width), so redraws and short scrolls reuse the same strings.
+        """
+        cache = self.fitted.setdefault(width, {})
+        fitted = cache.pop(text, None)  # re-inserted below: dicts keep insertion order, newest last
+        if fitted is None:
+            fitted = f"{text:<{width}.{width}}"
+            if len(cache) >= 4 * self.list_h:
+                del cache[next(iter(cache))]
+        cache[text] = fitted
+        return fitted
 
 
 def draw_ui(
-    stdscr,
+    screen,
     cwd,
-    entries,
+    entries_view,
+    visible,
     left_cursor,
     left_top,
     player,
@@ -382,168 +702,180 @@ def draw_ui(
     filter_text,
     search_mode,
 ):
-    stdscr.erase()
-    h, w = stdscr.getmaxyx()
-    mid = w // 2
-
-    # If terminal is too small, show a message instead of rendering UI
-    MIN_W, MIN_H = 120, 12  # tweak to taste
-    if w < MIN_W or h < MIN_H:
-        stdscr.erase()
-        msg = f"Terminal too small for pymus ({w}x{h}). Resize to at least {MIN_W}x{MIN_H}."
-        stdscr.addnstr(
-            h // 2,
-            max(0, (w - len(msg)) // 2),
-            msg,
-            max(0, w - 1),
-            curses.A_BOLD,
-        )
-        stdscr.refresh()
+    """
+    Repaint the regions whose state changed since the last call (each into
+    its own sub-window via noutrefresh), then update the terminal once.
+    """
+    if screen.too_small:
+        curses.doupdate()
         return
 
-    header = f"NCurses Music Player  |  Folder: {cwd}"
-    stdscr.addnstr(0, 0, header, w - 1, curses.A_REVERSE)
+    w = screen.w
 
-    BOLD = curses.color_pair(2) | curses.A_BOLD  # | curses.A_REVERSE
-    REG = curses.color_pair(1)  # curses.A_REVERSE
-    if search_mode:
-        help_line = "SEARCH MODE: type to filter | Enter=accept | Esc=cancel | BS=delete | Ctrl+U=clear"
-        stdscr.addnstr(h - 1, 0, help_line, w - 1, curses.A_REVERSE)
-    else:
-        draw_help_line(
-            stdscr,
-            h - 1,
-            [
-                ("Tab", BOLD),
-                ("=switch pane | ", REG),
-                ("Enter", BOLD),
-                ("=open/play | ", REG),
-                ("s", BOLD),
-                ("=queue/play folder | ", REG),
-                ("a", BOLD),
-                ("=append track | ", REG),
-                ("Right", BOLD),
-                (": ", REG),
-                ("x", BOLD),
-                ("/", REG),
-                ("delete", BOLD),
-                ("=delete item ", REG),
-                ("d", BOLD),
-                ("=move down ", REG),
-                ("u", BOLD),
-                ("=move up ", REG),
-                ("c", BOLD),
-                ("=clear all | ", REG),
-                ("f", BOLD),
-                ("=shuffle future | ", REG),
-                ("Space", BOLD),
-                ("=pause | ", REG),
-                ("n", BOLD),
-                ("=next | ", REG),
-                ("p", BOLD),
-                ("=prev | ", REG),
-                ("b", BOLD),
-                ("=back | ", REG),
-                ("/", BOLD),
-                ("=search | ", REG),
-                ("q", BOLD),
-                ("=quit", REG),
-            ],
-        )
-
-    list_h = h - 4
+    # --- Header ---
+    header = f"NCurses Music Player  |  Folder: {cwd}"
+    if screen.changed("header", header):
+        win = screen.header_win
+        win.erase()
+        win.addnstr(0, 0, header, w - 1, curses.A_REVERSE)
+        win.noutrefresh()
 
     # --- Left pane (browser) ---
-    left_w = mid - 1
-    filt = f" /{filter_text}" if filter_text else ""
-    mode = " [SEARCH]" if search_mode else ""
-    left_title = f" Browser{filt}{mode} "
-    left_attr = curses.A_BOLD | (curses.A_STANDOUT if focus == "left" else 0)
-    stdscr.addnstr(1, 0, left_title.ljust(left_w), left_w, left_attr)
-
-    for i in range(list_h - 1):
-        idx = left_top + i
-        if idx >= len(entries):
-            break
-        e = entries[idx]
-        name = e.name + ("/" if e.is_dir() else "")
-        attr = curses.A_BOLD if e.is_dir() else curses.A_NORMAL
-        if idx == left_cursor and focus == "left" and not search_mode:
-            attr |= curses.A_REVERSE
-        stdscr.addnstr(2 + i, 0, name.ljust(left_w)[:left_w], left_w, attr)
-
-    # Divider
-    for y in range(1, h - 1):
-        stdscr.addch(y, mid - 1, "|")
+    left_w = screen.left_w
+    last = screen.list_h - 1  # the panes' bottom row: its final cell can't be written
+    if screen.changed("left", (entries_view, visible, left_cursor, left_top, focus, filter_text, search_mode)):
+        win = screen.left_win
+        win.erase()
+        filt = f" /{filter_text}" if filter_text else ""
+        mode = " [SEARCH]" if search_mode else ""
+        left_title = f" Browser{filt}{mode} "
+        left_attr = curses.A_BOLD | (curses.A_STANDOUT if focus == "left" else 0)
+        win.addnstr(0, 0, left_title.ljust(left_w), left_w, left_attr)
+
+        for i in range(screen.list_h):
+            idx = left_top + i
+            if idx >= len(visible):
+                break
+            name, attr = entries_view[visible[idx]]
+            if idx == left_cursor and focus == "left" and not search_mode:
+                attr |= curses.A_REVERSE
+            win.addnstr(1 + i, 0, screen.fit(name, left_w), left_w if i < last else left_w - 1, attr)
+        win.noutrefresh()
 
     # --- Right pane (queue) ---
-    right_x = mid
-    right_w = w - mid
-    right_title = f" Queue ({len(player.queue)}) "
-    right_attr = curses.A_BOLD | (curses.A_STANDOUT if focus == "right" else 0)
-    stdscr.addnstr(1, right_x, right_title.ljust(right_w), right_w, right_attr)
-
-    queue = player.queue
-    for i in range(list_h - 1):
-        idx = right_top + i
-        if idx >= len(queue):
-            break
-        track = queue[idx]
-        name = track.name
-        attr = curses.A_NORMAL
-        if idx == player.idx:
-            attr |= curses.A_BOLD
-        if idx == right_cursor and focus == "right":
-            attr |= curses.A_REVERSE
-        stdscr.addnstr(2 + i, right_x, name.ljust(right_w)[:right_w], right_w, attr)
+    right_w = screen.right_w
+    if screen.changed("right", (player.version, player.idx, right_cursor, right_top, focus)):
+        win = screen.right_win
+        win.erase()
+        right_title = f" Queue ({len(player.queue)}) "
+        right_attr = curses.A_BOLD | (curses.A_STANDOUT if focus == "right" else 0)
+        win.addnstr(0, 0, right_title.ljust(right_w), right_w, right_attr)
+
+        names = player.names
+        for i in range(screen.list_h):
+            idx = right_top + i
+            if idx >= len(names):
+                break
+            name = names[idx]
+            attr = curses.A_NORMAL
+            if idx == player.idx:
+                attr |= curses.A_BOLD
+            if idx == right_cursor and focus == "right":
+                attr |= curses.A_REVERSE
+            win.addnstr(1 + i, 0, screen.fit(name, right_w), right_w if i < last else right_w - 1, attr)
+        win.noutrefresh()
 
     #
-    # --- Now Playing + Progress Bar (keep existing functionality)
+    # --- Footer: one row each for status message, progress, now playing, help.
+    # Rows are diffed individually; the footer is only pushed if one changed.
     #
-    cur = player.current()
-    np_line = "Progress: "
-    stdscr.addnstr(h - 3, 0, np_line, w - 1)
+    win = screen.footer_win
+    footer_changed = False
 
-    pos, length = player.progress()
+    if screen.changed("status", status_msg):
+        win.move(0, 0)
+        win.clrtoeol()
+        if status_msg:
+            win.addnstr(0, 0, status_msg, w - 1, curses.A_DIM)
+        footer_changed = True
 
-    def fmt_mmss(t):
-        t = max(0, int(t))
-        m = t // 60
-        s = t % 60
-        return f"{m}:{s:02d}"
-
-    if length > 0:
-        bar_w = max(10, w - 30)
-        filled = int((pos / length) * bar_w)
-        bar = "[" + "#" * filled + "-" * (bar_w - filled) + "]"
-        time_line = f"{bar} {fmt_mmss(pos)} / {fmt_mmss(length)}"
-    else:
-        time_line = "[----------] 0:00 / 0:00"
-    stdscr.addnstr(h - 3, max(0, w - len(time_line) - 1), time_line, len(time_line))
+    #
+    # --- Now Playing + Progress Bar (keep existing functionality)
+    #
+    pos, length = player.progress()
+    filled = int((pos / length) * screen.bar_w) if length > 0 else -1
+
+    if screen.changed("progress", (filled, int(pos), int(length))):
+        win.move(1, 0)
+        win.clrtoeol()
+        win.addnstr(1, 0, "Progress: ", w - 1)
+        if length > 0:
+            # The bar only changes when another cell fills, so keep the last one
+            if screen.bar[0] != filled:
+                screen.bar = (filled, "[" + "#" * filled + "-" * (screen.bar_w - filled) + "]")
+            time_line = f"{screen.bar[1]} {fmt_mmss(int(pos))} / {fmt_mmss(int(length))}"
+        else:
+            time_line = "[----------] 0:00 / 0:00"
+        win.addnstr(1, max(0, w - len(time_line) - 1), time_line, len(time_line))
+        footer_changed = True
 
     #
     # --- New permanent playback-status line (centered + dim)
     #
-    if cur:
-        np2_label = get_id3_label(cur) if cur else "-"
+    np2_label = player.current_label()
+    if np2_label is not None:
         status_line = f"Now Playing: {np2_label}"
     else:
         status_line = " -- nothing being played ---"
 
-    # centre horizontally
-    x = max(0, (w - len(status_line)) // 2)
-
-    stdscr.addnstr(h - 2, x, status_line, len(status_line), NOWPLAYING_COLOR)
-
-    if status_msg:
-        stdscr.addnstr(h - 4, 0, status_msg, w - 1, curses.A_DIM)
-
-    stdscr.refresh()
+    if screen.changed("nowplaying", status_line):
+        # centre horizontally
+        x = max(0, (w - len(status_line)) // 2)
+        win.move(2, 0)
+        win.clrtoeol()
+        win.addnstr(2, x, status_line, min(len(status_line), w - 1 - x), NOWPLAYING_COLOR)
+        footer_changed = True
+
+    if screen.changed("help", search_mode):
+        win.move(3, 0)
+        win.clrtoeol()
+        BOLD = curses.color_pair(2) | curses.A_BOLD  # | curses.A_REVERSE
+        REG = curses.color_pair(1)  # curses.A_REVERSE
+        if search_mode:
+            help_line = "SEARCH MODE: type to filter | Enter=accept | Esc=cancel | BS=delete | Ctrl+U=clear"
+            win.addnstr(3, 0, help_line, w - 1, curses.A_REVERSE)
+        else:
+            draw_help_line(
+                win,
+                3,
+                [
+                    ("Tab", BOLD),
+                    ("=switch pane | ", REG),
+                    ("Enter", BOLD),
+                    ("=open/play | ", REG),
+                    ("s", BOLD),
+                    ("=queue/play folder | ", REG),
+                    ("a", BOLD),
+                    ("=append track | ", REG),
+                    ("Right", BOLD),
+                    (": ", REG),
+                    ("x", BOLD),
+                    ("/", REG),
+                    ("delete", BOLD),
+                    ("=delete item ", REG),
+                    ("d", BOLD),
+                    ("=move down ", REG),
+                    ("u", BOLD),
+                    ("=move up ", REG),
+                    ("c", BOLD),
+                    ("=clear all | ", REG),
+                    ("f", BOLD),
+                    ("=shuffle future | ", REG),
+                    ("Space", BOLD),
+                    ("=pause | ", REG),
+                    ("n", BOLD),
+                    ("=next | ", REG),
+                    ("p", BOLD),
+                    ("=prev | ", REG),
+                    ("b", BOLD),
+                    ("=back | ", REG),
+                    ("/", BOLD),
+                    ("=search | ", REG),
+                    ("q", BOLD),
+                    ("=quit", REG),
+                ],
+            )
+        footer_changed = True
+
+    if footer_changed:
+        win.noutrefresh()
+
+    curses.doupdate()
 
 
 def main(stdscr):
     curses.curs_set(0)
-    stdscr.nodelay(True)
+    stdscr.timeout(30)  # getch waits up to 30 ms for a key instead of spinning
     stdscr.keypad(True)
     global NOWPLAYING_COLOR
     try:
@@ -554,11 +886,16 @@ def main(stdscr):
     except Exception:
         NOWPLAYING_COLOR = curses.A_BOLD
 
+    screen = Screen(stdscr)
     cwd = MUSIC_ROOT if MUSIC_ROOT.exists() else Path.home()
 
+    # all_entries (+ lowercased names and display strings) change only with cwd;
+    # visible holds the indices into them that pass the current filter.
     all_entries = list_dir(cwd)
+    all_names = [p.name.lower() for p, _ in all_entries]
+    entries_view = build_entries_view(all_entries)
     filter_text = ""
-    entries = apply_filter(all_entries, filter_text)
+    visible = apply_filter(all_names, filter_text)
 
     focus = "left"
 
@@ -573,289 +910,338 @@ def main(stdscr):
     # Auto-load previous playlist (do NOT autoplay)
     loaded_queue, loaded_idx = load_playlist_state()
     if loaded_queue:
-        player.queue = loaded_queue
+        player.set_queue(loaded_queue)
         player.idx = loaded_idx
         right_cursor = clamp(loaded_idx, 0, len(player.queue) - 1)
         status_msg = f"Restored playlist ({len(player.queue)} tracks)"
 
     last_tick = time.time()
 
+    # Redraw only when something visible changed: a key was handled, the
+    # player moved on, or the progress display ticked over a second.
+    dirty = True
+    shown_progress = None
+
+    # Folder scans run on a worker thread so the UI keeps redrawing meanwhile.
+    # scan = (future, action, sel) while one is in flight, else None.
+    scanner = ThreadPoolExecutor(max_workers=1)
+    scan_stop = Event()  # set on exit to abandon an in-flight scan
+    scan = None
+
     # Search mode state
     search_mode = False
     filter_before_search = ""
 
+    running = True
     try:
-        while True:
-            if player.queue and player.player.get_state() == vlc.State.Ended:  # type: ignore
+        while running:
+            if player.track_ended() and player.queue:
                 player.next()
-            if focus != "right" and player.idx >= 0:
+                dirty = True
+            ####################################################################
+            # Apply a finished background folder scan
+            if scan and scan[0].done():
+                future, action, sel = scan
+                scan = None
+                dirty = True
+                mp3s = future.result()
+                if action == "append":
+                    if mp3s:
+                        player.add_to_queue(mp3s)
+                        status_msg = f"Appended {len(mp3s)} MP3s from {sel.name}/"
+                    else:
+                        status_msg = f"No MP3s found in {sel.name}/"
+                    if player.idx >= 0:
+                        right_cursor = player.idx
+                elif action == "track":
+                    player.set_queue(mp3s)
+                    player.idx = mp3_index(mp3s, sel)
+                    player.play_current()
+                    right_cursor = player.idx
+                    status_msg = f"Playing {sel.name}"
+                else:  # "folder"
+                    player.set_queue(mp3s)
+                    if mp3s:
+                        player.play_current()
+                        right_cursor = player.idx
+                        status_msg = f"Queued {len(mp3s)} MP3s from {sel.name}/"
+                    else:
+                        status_msg = f"No MP3s found in {sel.name}/"
+            if focus != "right" and player.idx >= 0 and right_cursor != player.idx:
                 right_cursor = player.idx
+                dirty = True
             now = time.time()
             if now - last_tick > 0.03:
-                h, w = stdscr.getmaxyx()
-                list_h = h - 3
-                left_top = ensure_visible(left_cursor, left_top, list_h - 1, len(entries))
-                right_top = ensure_visible(right_cursor, right_top, list_h - 1, len(player.queue))
-                draw_ui(stdscr, cwd, entries, left_cursor, left_top, player, right_cursor, right_top, focus, status_msg, filter_text, search_mode)
+                pos, length = player.progress()
+                if (int(pos), int(length)) != shown_progress:
+                    shown_progress = (int(pos), int(length))
+                    dirty = True
+                if dirty:
+                    left_top = ensure_visible(left_cursor, left_top, screen.list_h, len(visible))
+                    right_top = ensure_visible(right_cursor, right_top, screen.list_h, len(player.queue))
+                    draw_ui(screen, cwd, entries_view, visible, left_cursor, left_top, player, right_cursor, right_top, focus, status_msg, filter_text, search_mode)
+                    dirty = False
                 last_tick = now
             key = stdscr.getch()
             if key == -1:
                 continue
-            status_msg = ""
-            ########################################################################
-            # --- SEARCH MODE HANDLING (left pane only) ---
-            if search_mode:
-                # Esc cancels search and restores previous filter
-                if key == 27:
-                    search_mode = False
-                    filter_text = filter_before_search
-                    entries = apply_filter(all_entries, filter_text)
-                    left_cursor, left_top = 0, 0
+            # Drain every key that is already waiting (e.g. a held j or PgDn) and
+            # apply them all before the next redraw, rather than one per frame.
+            keys = [key]
+            stdscr.timeout(0)
+            while (key := stdscr.getch()) != -1:
+                keys.append(key)
+            stdscr.timeout(30)
+            # Every handled key may change what is on screen (status_msg at least)
+            dirty = True
+            for key in keys:
+                # Terminal resized: ncurses handles SIGWINCH itself and reports it
+                # as a key, so the layout is only rebuilt here, never polled for.
+                if key == curses.KEY_RESIZE:
+                    screen.resize()
                     continue
+                status_msg = ""
+                ########################################################################
+                # --- SEARCH MODE HANDLING (left pane only) ---
+                if search_mode:
+                    # Esc cancels search and restores previous filter
+                    if key == 27:
+                        search_mode = False
+                        filter_text = filter_before_search
+                        visible = apply_filter(all_names, filter_text)
+                        left_cursor, left_top = 0, 0
+                        continue
 
-                # Enter accepts current filter and exits search mode
-                if key in (curses.KEY_ENTER, 10, 13):
-                    search_mode = False
-                    continue
+                    # Enter accepts current filter and exits search mode
+                    if key in (curses.KEY_ENTER, 10, 13):
+                        search_mode = False
+                        continue
+
+                    # Backspace deletes
+                    if key in (curses.KEY_BACKSPACE, 127, 8):
+                        if filter_text:
+                            filter_text = filter_text[:-1]
+                            visible = apply_filter(all_names, filter_text)
+                            left_cursor, left_top = 0, 0
+                        continue
 
-                # Backspace deletes
-                if key in (curses.KEY_BACKSPACE, 127, 8):
-                    if filter_text:
-                        filter_text = filter_text[:-1]
-                        entries = apply_filter(all_entries, filter_text)
+                    # Ctrl+U clears
+                    if key == 21:
+                        filter_text = ""
+                        visible = apply_filter(all_names, filter_text)
                         left_cursor, left_top = 0, 0
-                    continue
+                        continue
 
-                # Ctrl+U clears
-                if key == 21:
-                    filter_text = ""
-                    entries = all_entries
-                    left_cursor, left_top = 0, 0
+                    # Printable chars add to filter (no reserved keys here)
+                    if 32 <= key <= 126:
+                        # Extending the filter only needs to re-check current matches
+                        visible = apply_filter(all_names, filter_text + chr(key), filter_text, visible)
+                        filter_text += chr(key)
+                        left_cursor, left_top = 0, 0
                     continue
 
-                # Printable chars add to filter (no reserved keys here)
-                if 32 <= key <= 126:
-                    filter_text += chr(key)
-                    entries = apply_filter(all_entries, filter_text)
+                ####################################################################
+                # --- NORMAL MODE HANDLING ---
+                ########################################################################
+                # Quit
+                if key in (ord("q"), 27):
+                    running = False
+                    break
+                ############################################################################
+                # Start search mode
+                elif key == ord("/") and focus == "left":
+                    search_mode = True
+                    filter_before_search = filter_text
+                    filter_text = ""  # fresh search each time
+                    visible = apply_filter(all_names, filter_text)
                     left_cursor, left_top = 0, 0
-                continue
 
-            ####################################################################
-            # --- NORMAL MODE HANDLING ---
-            ########################################################################
-            # Quit
-            if key in (ord("q"), 27):
-                break
-            ############################################################################
-            # Start search mode
-            elif key == ord("/") and focus == "left":
-                search_mode = True
-                filter_before_search = filter_text
-                filter_text = ""  # fresh search each time
-                entries = all_entries
-                left_cursor, left_top = 0, 0
-
-            ########################################################################
-            # Switch pane
-            elif key == 9:  # Tab
-                focus = "right" if focus == "left" else "left"
-
-            ########################################################################
-            # Up/Down
-            elif key in (curses.KEY_DOWN, ord("j")):
-                if focus == "left":
-                    left_cursor = clamp(left_cursor + 1, 0, max(0, len(entries) - 1))
-                else:
-                    right_cursor = clamp(right_cursor + 1, 0, max(0, len(player.queue) - 1))
+                ########################################################################
+                # Switch pane
+                elif key == 9:  # Tab
+                    focus = "right" if focus == "left" else "left"
 
-            ########################################################################
-            elif key in (curses.KEY_UP, ord("k")):
-                if focus == "left":
-                    left_cursor = clamp(left_cursor - 1, 0, max(0, len(entries) - 1))
-                else:
-                    right_cursor = clamp(right_cursor - 1, 0, max(0, len(player.queue) - 1))
-
-            ########################################################################
-            # Page Down / Page Up
-            elif key == curses.KEY_NPAGE:
-                h, w = stdscr.getmaxyx()
-                list_h = h - 3
-                page = max(1, list_h - 1)
-                if focus == "left":
-                    left_cursor = clamp(left_cursor + page, 0, max(0, len(entries) - 1))
-                else:
-                    right_cursor = clamp(right_cursor + page, 0, max(0, len(player.queue) - 1))
-
-            ########################################################################
-            elif key == curses.KEY_PPAGE:
-                h, w = stdscr.getmaxyx()
-                list_h = h - 3
-                page = max(1, list_h - 1)
-                if focus == "left":
-                    left_cursor = clamp(left_cursor - page, 0, max(0, len(entries) - 1))
-                else:
-                    right_cursor = clamp(right_cursor - page, 0, max(0, len(player.queue) - 1))
+                ########################################################################
+                # Up/Down
+                elif key in (curses.KEY_DOWN, ord("j")):
+                    if focus == "left":
+                        left_cursor = clamp(left_cursor + 1, 0, max(0, len(visible) - 1))
+                    else:
+                        right_cursor = clamp(right_cursor + 1, 0, max(0, len(player.queue) - 1))
 
-            ########################################################################
-            # Enter
-            elif key in (curses.KEY_ENTER, 10, 13):
-                if focus == "left":
-                    if not entries:
-                        continue
-                    sel = entries[left_cursor]
-                    if sel.is_dir():
-                        cwd = sel
-                        all_entries = list_dir(cwd)
-                        filter_text = ""
-                        entries = all_entries
-                        left_cursor, left_top = 0, 0
+                ########################################################################
+                elif key in (curses.KEY_UP, ord("k")):
+                    if focus == "left":
+                        left_cursor = clamp(left_cursor - 1, 0, max(0, len(visible) - 1))
                     else:
-                        mp3s = collect_mp3s(cwd)
-                        player.set_queue(mp3s)
-                        try:
-                            player.idx = mp3s.index(sel)
-                        except ValueError:
-                            player.idx = 0
-                        player.play_current()
-                        right_cursor = player.idx
-                        status_msg = f"Playing {sel.name}"
-                else:
-                    if player.queue:
-                        player.play_index(right_cursor)
-                        status_msg = f"Playing {player.current().name}"  # type: ignore
-
-            ########################################################################
-            # 's' to queue/play folder
-            elif key == ord("s"):
-                if focus == "left":
-                    if not entries:
-                        continue
-                    sel = entries[left_cursor]
-                    if sel.is_dir():
-                        mp3s = collect_mp3s(sel)
-                        player.set_queue(mp3s)
-                        if mp3s:
-                            player.play_current()
-                            right_cursor = player.idx
-                            status_msg = f"Queued {len(mp3s)} MP3s from {sel.name}/"
+                        right_cursor = clamp(right_cursor - 1, 0, max(0, len(player.queue) - 1))
+
+                ########################################################################
+                # Page Down / Page Up
+                elif key == curses.KEY_NPAGE:
+                    page = max(1, screen.list_h)
+                    if focus == "left":
+                        left_cursor = clamp(left_cursor + page, 0, max(0, len(visible) - 1))
+                    else:
+                        right_cursor = clamp(right_cursor + page, 0, max(0, len(player.queue) - 1))
+
+                ########################################################################
+                elif key == curses.KEY_PPAGE:
+                    page = max(1, screen.list_h)
+                    if focus == "left":
+                        left_cursor = clamp(left_cursor - page, 0, max(0, len(visible) - 1))
+                    else:
+                        right_cursor = clamp(right_cursor - page, 0, max(0, len(player.queue) - 1))
+
+                ########################################################################
+                # Enter
+                elif key in (curses.KEY_ENTER, 10, 13):
+                    if focus == "left":
+                        if not visible:
+                            continue
+                        sel, sel_is_dir = all_entries[visible[left_cursor]]
+                        if sel_is_dir:
+                            cwd = sel
+                            all_entries = list_dir(cwd)
+                            all_names = [p.name.lower() for p, _ in all_entries]
+                            entries_view = build_entries_view(all_entries)
+                            filter_text = ""
+                            visible = apply_filter(all_names, filter_text)
+                            left_cursor, left_top = 0, 0
+                        elif scan:
+                            status_msg = SCAN_BUSY_MSG
                         else:
-                            status_msg = f"No MP3s found in {sel.name}/"
+                            scan = (scanner.submit(collect_mp3s, cwd, scan_stop), "track", sel)
+                            status_msg = f"Scanning {cwd.name}/ ..."
                     else:
-                        mp3s = collect_mp3s(cwd)
-                        player.set_queue(mp3s)
-                        try:
-                            player.idx = mp3s.index(sel)
-                        except ValueError:
-                            player.idx = 0
-                        player.play_current()
-                        right_cursor = player.idx
-                        status_msg = f"Playing {sel.name}"
-                else:
-                    if player.queue:
-                        player.play_index(right_cursor)
-                        status_msg = f"Playing {player.current().name}"  # type: ignore
-
-            ########################################################################
-            # 'a' = APPEND behaviour
-            elif key == ord("a"):
-                if focus == "left":
-                    if not entries:
-                        continue
-                    sel = entries[left_cursor]
-
-                    if sel.is_dir():
-                        # Folder: append all MP3s in folder (recursive)
-                        mp3s = collect_mp3s(sel)
-                        if mp3s:
-                            player.add_to_queue(mp3s)
-                            status_msg = f"Appended {len(mp3s)} MP3s from {sel.name}/"
+                        if player.queue:
+                            player.play_index(right_cursor)
+                            status_msg = f"Playing {player.current_name()}"
+
+                ########################################################################
+                # 's' to queue/play folder
+                elif key == ord("s"):
+                    if focus == "left":
+                        if not visible:
+                            continue
+                        sel, sel_is_dir = all_entries[visible[left_cursor]]
+                        if scan:
+                            status_msg = SCAN_BUSY_MSG
+                        elif sel_is_dir:
+                            scan = (scanner.submit(collect_mp3s, sel, scan_stop), "folder", sel)
+                            status_msg = f"Scanning {sel.name}/ ..."
                         else:
-                            status_msg = f"No MP3s found in {sel.name}/"
-
+                            scan = (scanner.submit(collect_mp3s, cwd, scan_stop), "track", sel)
+                            status_msg = f"Scanning {cwd.name}/ ..."
                     else:
-                        # File: append only this MP3
-                        player.add_to_queue([sel])
-                        status_msg = f"Appended {sel.name}"
+                        if player.queue:
+                            player.play_index(right_cursor)
+                            status_msg = f"Playing {player.current_name()}"
+
+                ########################################################################
+                # 'a' = APPEND behaviour
+                elif key == ord("a"):
+                    if focus == "left":
+                        if not visible:
+                            continue
+                        sel, sel_is_dir = all_entries[visible[left_cursor]]
+
+                        if sel_is_dir:
+                            # Folder: append all MP3s in folder (recursive), once scanned
+                            if scan:
+                                status_msg = SCAN_BUSY_MSG
+                            else:
+                                scan = (scanner.submit(collect_mp3s, sel, scan_stop), "append", sel)
+                                status_msg = f"Scanning {sel.name}/ ..."
 
-                    # Update queue cursor if player is already playing something
-                    if player.idx >= 0:
-                        right_cursor = player.idx
-
-                else:
-                    # Right pane: pressing 'a' does nothing (safe no-op)
-                    status_msg = ""
-
-            ########################################################################
-            # Back directory
-            elif key == ord("b"):
-                parent = cwd.parent
-                if parent != cwd:
-                    cwd = parent
-                    all_entries = list_dir(cwd)
-                    filter_text = ""
-                    entries = all_entries
-                    left_cursor, left_top = 0, 0
-
-            ########################################################################
-            # Playback controls
-            elif key == ord(" "):
-                player.toggle_pause()
+                        else:
+                            # File: append only this MP3
+                            player.add_to_queue([sel])
+                            status_msg = f"Appended {sel.name}"
 
-            ########################################################################
-            # Next track
-            elif key == ord("n"):
-                player.next()
-                right_cursor = player.idx
+                        # Update queue cursor if player is already playing something
+                        if player.idx >= 0:
+                            right_cursor = player.idx
 
-            ########################################################################
-            # Previous track
-            elif key == ord("p"):
-                player.prev()
-                right_cursor = player.idx
+                    else:
+                        # Right pane: pressing 'a' does nothing (safe no-op)
+                        status_msg = ""
+
+                ########################################################################
+                # Back directory
+                elif key == ord("b"):
+                    parent = cwd.parent
+                    if parent != cwd:
+                        cwd = parent
+                        all_entries = list_dir(cwd)
+                        all_names = [p.name.lower() for p, _ in all_entries]
+                        entries_view = build_entries_view(all_entries)
+                        filter_text = ""
+                        visible = apply_filter(all_names, filter_text)
+                        left_cursor, left_top = 0, 0
 
-            ########################################################################
-            # Delete selected queue item (right pane)
-            elif (key in (curses.KEY_DC, 330) or key == ord("x")) and focus == "right":
-                if player.queue:
-                    player.remove_index(right_cursor)
-                    # Clamp cursor to new queue size
-                    right_cursor = clamp(right_cursor, 0, max(0, len(player.queue) - 1))
-                    status_msg = "Deleted item from queue"
-
-            ########################################################################
-            # Move selected item DOWN (right pane)
-            elif key == ord("d") and focus == "right":
-                if player.queue and right_cursor < len(player.queue) - 1:
-                    player.move_index(right_cursor, +1)
-                    right_cursor += 1
-                    status_msg = "Moved item down"
-
-            ########################################################################
-            # Move selected item UP (right pane)
-            elif key == ord("u") and focus == "right":
-                if player.queue and right_cursor > 0:
-                    player.move_index(right_cursor, -1)
-                    right_cursor -= 1
-                    status_msg = "Moved item up"
-
-            ########################################################################
-            # Clear playlist (right pane)
-            elif key == ord("c") and focus == "right":
-                player.clear_queue()
-                right_cursor = 0
-                right_top = 0
-                status_msg = "Cleared playlist"
-
-            ########################################################################
-            # Shuffle future queue (right pane)
-            elif key == ord("f") and focus == "right":
-                if player.queue:
-                    player.shuffle_future()
-                    # Keep selection on current track if one is active; otherwise stay at top.
-                    right_cursor = player.idx if player.idx >= 0 else 0
-                    status_msg = "Shuffled upcoming tracks"
+                ########################################################################
+                # Playback controls
+                elif key == ord(" "):
+                    player.toggle_pause()
+
+                ########################################################################
+                # Next track
+                elif key == ord("n"):
+                    player.next()
+                    right_cursor = player.idx
+
+                ########################################################################
+                # Previous track
+                elif key == ord("p"):
+                    player.prev()
+                    right_cursor = player.idx
+
+                ########################################################################
+                # Delete selected queue item (right pane)
+                elif (key in (curses.KEY_DC, 330) or key == ord("x")) and focus == "right":
+                    if player.queue:
+                        player.remove_index(right_cursor)
+                        # Clamp cursor to new queue size
+                        right_cursor = clamp(right_cursor, 0, max(0, len(player.queue) - 1))
+                        status_msg = "Deleted item from queue"
+
+                ########################################################################
+                # Move selected item DOWN (right pane)
+                elif key == ord("d") and focus == "right":
+                    if player.queue and right_cursor < len(player.queue) - 1:
+                        player.move_index(right_cursor, +1)
+                        right_cursor += 1
+                        status_msg = "Moved item down"
+
+                ########################################################################
+                # Move selected item UP (right pane)
+                elif key == ord("u") and focus == "right":
+                    if player.queue and right_cursor > 0:
+                        player.move_index(right_cursor, -1)
+                        right_cursor -= 1
+                        status_msg = "Moved item up"
+
+                ########################################################################
+                # Clear playlist (right pane)
+                elif key == ord("c") and focus == "right":
+                    player.clear_queue()
+                    right_cursor = 0
+                    right_top = 0
+                    status_msg = "Cleared playlist"
+
+                ########################################################################
+                # Shuffle future queue (right pane)
+                elif key == ord("f") and focus == "right":
+                    if player.queue:
+                        player.shuffle_future()
+                        # Keep selection on current track if one is active; otherwise stay at top.
+                        right_cursor = player.idx if player.idx >= 0 else 0
+                        status_msg = "Shuffled upcoming tracks"
 
     finally:
+        scan_stop.set()
+        scanner.shutdown(wait=False, cancel_futures=True)
         # Save playlist state on exit
         save_playlist_state(player)
         player.player.stop()